@@ -1,21 +1,23 @@
 from typing import Union
 
-from node import Node
+from formula import Formula
 
 
 class Cell:
     """
     This class serves as a container for values relevant for a specific cell in a sheet.
     """
+    # A cell object is kept for every filled cell in the sheet, so it is stored in fixed slots.
+    __slots__ = ("__content", "__parsed_content")
 
-    def __init__(self, cell_content: str, parsed_content: Union[str, float, Node]):
+    def __init__(self, cell_content: str, parsed_content: Union[str, float, Formula]):
         """
         Initializes the Cell with raw and parsed content.
         :param cell_content: The raw string content of the cell.
-        :param parsed_content: The content of the cell that has been parsed into a str, float, or Node.
+        :param parsed_content: The content of the cell that has been parsed into a str, float, or Formula.
         """
         self.__content: str = cell_content
-        self.__parsed_content: Union[str, float, Node] = parsed_content
+        self.__parsed_content: Union[str, float, Formula] = parsed_content
 
     def get_content(self) -> str:
         """
@@ -23,7 +25,7 @@ class Cell:
         """
         return self.__content
 
-    def get_parsed_content(self) -> Union[str, float, Node]:
+    def get_parsed_content(self) -> Union[str, float, Formula]:
         """
         Returns the parsed content of the cell.
         """
@@ -0,0 +1,188 @@
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Set, List, Hashable, Iterable, Callable, AbstractSet, Iterator
+
+from exceptions import CircularDependenciesException
+
+Vertex = Hashable  # A sheet position, in practice.
+
+
+class DependencyGraph:
+    """
+    A directed acyclic graph of the dependencies between cells, updated in place.
+
+    Every vertex that has at least one edge holds an index in a topological order, in which each vertex comes after all
+    the vertices it depends on (i.e. a valid evaluation order). The order is maintained incrementally with the
+    Pearce-Kelly algorithm: adding an edge only reorders the vertices between its two ends that are reachable from
+    them, and the same search detects the cycles that the edge would close. Vertices that lose all of their edges are
+    removed from the graph.
+
+    Attributes:
+        __dependencies (Dict[Vertex, Set[Vertex]]): The vertices that each vertex depends on (its out edges).
+        __dependents (Dict[Vertex, Set[Vertex]]): The vertices that depend on each vertex (its in edges).
+        __order (Dict[Vertex, int]): The index of each vertex in the topological order. Indexes are unique, but not
+            necessarily consecutive.
+        __next_order (int): The index to give to the next vertex added to the graph.
+    """
+
+    def __init__(self) -> None:
+        self.__dependencies: Dict[Vertex, Set[Vertex]] = {}
+        self.__dependents: Dict[Vertex, Set[Vertex]] = {}
+        self.__order: Dict[Vertex, int] = {}
+        self.__next_order: int = 0
+
+    def get_dependencies(self, vertex: Vertex) -> Set[Vertex]:
+        """Returns a copy of the set of vertices that the given vertex directly depends on."""
+        return set(self.__dependencies.get(vertex, ()))
+
+    def has_dependents(self, vertex: Vertex) -> bool:
+        """Returns whether any vertex directly depends on the given vertex."""
+        return bool(self.__dependents.get(vertex))
+
+    def depends_on_any(self, vertex: Vertex, vertices: AbstractSet[Vertex]) -> bool:
+        """Returns whether the given vertex directly depends on at least one of the given vertices."""
+        return not self.__dependencies.get(vertex, set()).isdisjoint(vertices)
+
+    def set_dependencies(self, vertex: Vertex, dependencies: AbstractSet[Vertex]) -> None:
+        """
+        Replaces the dependencies (out edges) of the given vertex.
+        The update is atomic - if it fails, the graph is left as it was.
+        :param vertex: The vertex to update.
+        :param dependencies: The vertices that the given vertex depends on from now on.
+        :raises CircularDependenciesException: If the new dependencies create a cycle in the graph.
+        """
+        current_dependencies = self.__dependencies.get(vertex, set())
+        removed_dependencies = current_dependencies - dependencies
+        added_dependencies = dependencies - current_dependencies
+        for dependency in removed_dependencies:
+            self.__remove_edge(vertex, dependency)
+        added_edges: List[Vertex] = []
+        try:
+            for dependency in added_dependencies:
+                self.__add_edge(vertex, dependency)
+                added_edges.append(dependency)
+        except CircularDependenciesException:
+            # Roll back. Restoring the removed edges cannot create a cycle, since the original graph had none.
+            for dependency in added_edges:
+                self.__remove_edge(vertex, dependency)
+            for dependency in removed_dependencies:
+                self.__add_edge(vertex, dependency)
+            raise
+
+    @contextmanager
+    def dependencies_transaction(self, vertex: Vertex, dependencies: AbstractSet[Vertex]) -> Iterator[None]:
+        """
+        Replaces the dependencies of the given vertex for a block of work that may fail. If the block raises, the
+        previous dependencies are restored before the error propagates, so only the changed edges are touched in
+        either case.
+        :param vertex: The vertex to update.
+        :param dependencies: The vertices that the given vertex depends on from now on.
+        :raises CircularDependenciesException: If the new dependencies create a cycle in the graph (the block is not
+            run, and the graph is not changed).
+        """
+        previous_dependencies = self.get_dependencies(vertex)
+        self.set_dependencies(vertex, dependencies)
+        try:
+            yield
+        except Exception:
+            # Restoring the previous edges cannot create a cycle, since the graph had none before the update.
+            self.set_dependencies(vertex, previous_dependencies)
+            raise
+
+    def dependents_in_order(self, vertex: Vertex) -> List[Vertex]:
+        """
+        Finds all the vertices that depend on the given vertex, directly or indirectly.
+        :param vertex: The vertex whose dependents are searched.
+        :return: The dependents in a valid evaluation order (each one after its own dependencies).
+            The given vertex itself is not included.
+        """
+        dependents: Set[Vertex] = set()
+        queue = deque(self.__dependents.get(vertex, ()))
+        while queue:
+            dependent = queue.popleft()
+            if dependent not in dependents:
+                dependents.add(dependent)
+                queue.extend(self.__dependents[dependent])
+        return sorted(dependents, key=self.__order.__getitem__)
+
+    def evaluation_order(self, vertices: Iterable[Vertex]) -> List[Vertex]:
+        """
+        Sorts the given vertices in a valid evaluation order (each one after its own dependencies).
+        Vertices that are not in the graph have no dependencies, so they are placed first.
+        """
+        order = self.__order
+        return sorted(vertices, key=lambda vertex: order.get(vertex, -1))
+
+    def __add_vertex(self, vertex: Vertex) -> None:
+        """Adds a vertex without edges at the end of the topological order, if it is not in the graph yet."""
+        if vertex not in self.__order:
+            self.__dependencies[vertex] = set()
+            self.__dependents[vertex] = set()
+            self.__order[vertex] = self.__next_order
+            self.__next_order += 1
+
+    def __discard_if_isolated(self, vertex: Vertex) -> None:
+        """Removes a vertex that has no edges, since it no longer has any meaning in the graph."""
+        if not self.__dependencies[vertex] and not self.__dependents[vertex]:
+            del self.__dependencies[vertex]
+            del self.__dependents[vertex]
+            del self.__order[vertex]
+
+    def __remove_edge(self, vertex: Vertex, dependency: Vertex) -> None:
+        """Removes an edge. A topological order stays valid when edges are removed, so nothing is reordered."""
+        self.__dependencies[vertex].discard(dependency)
+        self.__dependents[dependency].discard(vertex)
+        self.__discard_if_isolated(vertex)
+        self.__discard_if_isolated(dependency)
+
+    def __add_edge(self, vertex: Vertex, dependency: Vertex) -> None:
+        """
+        Adds an edge from a vertex to one of its dependencies, and reorders the affected region if the dependency
+        currently comes after the vertex in the topological order.
+        :raises CircularDependenciesException: If the edge closes a cycle. The graph is not changed in that case.
+        """
+        if vertex == dependency:
+            raise CircularDependenciesException("Cycle detected, new edges not added.")
+        self.__add_vertex(vertex)
+        self.__add_vertex(dependency)
+        lower_bound, upper_bound = self.__order[vertex], self.__order[dependency]
+        if upper_bound > lower_bound:
+            # The dependency must be evaluated first. Vertices that are ordered between the two ends are affected
+            # only if they are reachable from them.
+            forward_region = self.__reachable(vertex, self.__dependents, lambda order: order <= upper_bound)
+            if dependency in forward_region:
+                self.__discard_if_isolated(vertex)
+                self.__discard_if_isolated(dependency)
+                raise CircularDependenciesException("Cycle detected, new edges not added.")
+            backward_region = self.__reachable(dependency, self.__dependencies, lambda order: order >= lower_bound)
+            self.__reorder(backward_region, forward_region)
+        self.__dependencies[vertex].add(dependency)
+        self.__dependents[dependency].add(vertex)
+
+    def __reachable(self, start: Vertex, edges: Dict[Vertex, Set[Vertex]],
+                   in_region: Callable[[int], bool]) -> Set[Vertex]:
+        """
+        Finds the vertices reachable from the start vertex through the given edges, without leaving the affected
+        region of the order (the start vertex itself is always included).
+        """
+        reached = {start}
+        stack = [start]
+        while stack:
+            for neighbor in edges[stack.pop()]:
+                if neighbor not in reached and in_region(self.__order[neighbor]):
+                    reached.add(neighbor)
+                    stack.append(neighbor)
+        return reached
+
+    def __reorder(self, backward_region: Set[Vertex], forward_region: Set[Vertex]) -> None:
+        """
+        Reassigns the order indexes used by both regions, so all the backward region (the new dependency and what it
+        depends on) comes before all the forward region (the vertex and its dependents). The relative order inside each
+        region is kept.
+        """
+        order = self.__order
+        backward = sorted(backward_region, key=order.__getitem__)
+        forward = sorted(forward_region, key=order.__getitem__)
+        indexes = sorted(order[vertex] for vertex in backward + forward)
+        for vertex, index in zip(backward + forward, indexes):
+            order[vertex] = index
@@ -1,14 +1,21 @@
 import re
-from typing import Optional, List, Union, Tuple
+from typing import Optional, List, Union, Tuple, Dict, FrozenSet
 
 from exceptions import ParserException
 from math_operator import MathOperator, UnaryOperator, BinaryOperator, Associativity, RangeOperator
 from node import Node
+from numeric import NUMBER_PATTERN, is_number
+
+# Maps every open bracket to its matching close bracket.
+_BRACKET_PAIRS: Dict[str, str] = {"(": ")", "[": "]", "{": "}"}
+_OPEN_BRACKETS: FrozenSet[str] = frozenset(_BRACKET_PAIRS.keys())
+_CLOSE_BRACKETS: FrozenSet[str] = frozenset(_BRACKET_PAIRS.values())
+_BRACKETS: FrozenSet[str] = _OPEN_BRACKETS | _CLOSE_BRACKETS
 
 
 class ExpressionParser:
     """
-    Algebraic expression parser that converts algebraic expressions into a syntax tree or postfix notation.
+    Algebraic expression parser that converts algebraic expressions into a syntax tree.
 
     This parser supports a wide range of mathematical operations, including unary and binary operators, and
     special functionalities such as range operations within a specified context (e.g., spreadsheet formulas).
@@ -26,8 +33,8 @@ class ExpressionParser:
 
     Example:
         math_operators = [BinaryOperator("+", 1, Associativity.LTR), UnaryOperator("-", 2, Associativity.RTL)]
-        var_pattern = re.compile(r"^[A-Z]+[0-9]+$")
-        range_pattern = re.compile(r"^[A-Z]+[0-9]+:[A-Z]+[0-9]+$")
+        var_pattern = re.compile(r"[A-Z]+[0-9]+")
+        range_pattern = re.compile(r"[A-Z]+[0-9]+:[A-Z]+[0-9]+")
         parser = ExpressionParser(math_operators, var_pattern, range_pattern)
         root_node = parser.syntax_tree("A1+B2")
 
@@ -36,11 +43,11 @@ class ExpressionParser:
         used within applications like spreadsheet software or custom calculation tools.
 
     Attributes:
-        __operators (List[MathOperator]): A list of Operator objects that are valid in the expressions
-            this parser will parse.
         __pattern (re.Pattern): A compiled regular expression used to match variable locations within
             the expressions.
         __range_pattern (re.Pattern): A compiled regular expression used to match range expressions.
+        The patterns are matched at arbitrary positions of the expression during tokenization, and against whole
+        tokens during validation, so they should not be anchored with "^" or "$".
 
     Raises:
         ParserException: If the expression is invalid or cannot be parsed into a valid syntax tree.
@@ -51,7 +58,24 @@ class ExpressionParser:
         Initializes the ExpressionParser with a list of operators.
         :param math_operators: A list of Operator objects that are valid in the expressions this parser will parse.
         """
-        self.__operators = math_operators
+        # Precomputed set of operator symbols, for O(1) operator checks during tokenization.
+        self.__operator_symbols = frozenset(op.symbol for op in math_operators)
+        self.__max_operator_length = max((len(symbol) for symbol in self.__operator_symbols), default=0)
+        # Operator lookup table keyed by (symbol, operator kind). The first operator of each kind wins, as in a scan.
+        self.__operators_table: Dict[Tuple[str, type], MathOperator] = {}
+        for op in math_operators:
+            for operator_kind in (RangeOperator, BinaryOperator, UnaryOperator):
+                if isinstance(op, operator_kind):
+                    self.__operators_table.setdefault((op.symbol, operator_kind), op)
+        # Precedence of every item that can be pushed to the operators stack. Open brackets rank below every operator,
+        # so they stop the popping of operators without a separate type check.
+        bracket_precedence = min((op.precedence for op in math_operators), default=0) - 1
+        self.__stacked_precedences: Dict[Union[MathOperator, str], int] = dict.fromkeys(_OPEN_BRACKETS,
+                                                                                        bracket_precedence)
+        self.__stacked_precedences.update((op, op.precedence) for op in math_operators)
+        # The pop threshold depends only on the operator, so it is computed once per operator.
+        self.__pop_thresholds: Dict[MathOperator, int] = {op: self.__pop_precedence_threshold(op)
+                                                          for op in math_operators}
         self.__pattern = var_pattern
         self.__range_pattern = range_pattern
 
@@ -61,170 +85,172 @@ class ExpressionParser:
         :param token: The string to check.
         :return: True if the token is an operator, False otherwise.
         """
-        return any(op.symbol == token for op in self.__operators)
-
-    def __is_operand(self, string: str) -> bool:
-        """Checks whether the given string is a valid operand."""
-        return self.__is_number(string) or self.__is_location(string) or self.__is_range_token(string)
+        return token in self.__operator_symbols
 
     def __is_location(self, string: str) -> bool:
         """
         Checks whether a string is in the format of a valid location in the sheet,
         which is a column string of capital letters, followed by a row number.
         """
-        return bool(self.__pattern.match(string))
+        return bool(self.__pattern.fullmatch(string))
 
     def __is_range_token(self, string: str) -> bool:
-        return bool(self.__range_pattern.match(string))
-
-    @staticmethod
-    def __is_number(var: str) -> bool:
-        """
-        Checks whether a string can be parsed as a float number.
-        If it starts with a sign (+ or -), or is wrapped with spaces,
-        return false (should be considered as multiple tokens).
-        """
-        # Remove edge cases of float conversion.
-        if len(var.strip()) != len(var) or var.startswith("+") or var.startswith("-"):
-            return False
-        # Try to convert the string to a float. If succeeds - the string can be parsed as a float number.
-        try:
-            float(var)
-            return True
-        except ValueError:
-            return False
+        return bool(self.__range_pattern.fullmatch(string))
 
     @staticmethod
     def __is_open_bracket(char: str) -> bool:
         """Checks whether a string is an opening bracket."""
-        return char == "(" or char == "[" or char == "{"
+        return char in _OPEN_BRACKETS
 
     @staticmethod
     def __is_close_bracket(char: str) -> bool:
         """Checks whether a string is a closing bracket."""
-        return char == ")" or char == "]" or char == "}"
+        return char in _CLOSE_BRACKETS
 
-    def __is_bracket(self, char: str) -> bool:
+    @staticmethod
+    def __is_bracket(char: str) -> bool:
         """Checks whether a string is a bracket."""
-        return self.__is_close_bracket(char) or self.__is_open_bracket(char)
-
-    def __is_valid_token(self, token: str) -> bool:
-        """
-        Checks if a given string is a valid token in the context of the parser.
-        A valid token is either a bracket, a whitespace, an operand, or an operator.
-        :param token: The string to check.
-        :return: True if the token is valid, False otherwise.
-        """
-        return self.__is_bracket(token) or token.isspace() or self.__is_operand(token) or self.__is_operator(token)
+        return char in _BRACKETS
 
-    def __find_next_matching_token(self, expression: str, start_index: int) -> str:
+    def __match_token_length(self, expression: str, start_index: int) -> int:
         """
-        Finds the next valid token in the expression starting from the given index.
+        Finds the length of the longest operand or operator starting at the given index of the expression.
+        Each operand pattern is matched once from the start index (the regex engine finds its longest match),
+        and operator symbols are looked up from the longest possible symbol length downwards.
         :param expression: The expression being parsed.
-        :param start_index: The index from where to start the search.
-        :return: The longest valid token starting from the start_index.
-        Returns an empty string if no valid token is found.
+        :param start_index: The index from where to start the match.
+        :return: The length of the longest valid token starting at start_index, or 0 if no valid token is found.
         """
-        current_checked_substring = ""
-        longest_valid_token = ""
-        while start_index < len(expression):
-            current_checked_substring += expression[start_index]  # the char in the expression at position idx.
-            if self.__is_valid_token(current_checked_substring):
-                longest_valid_token = current_checked_substring
-            start_index += 1
-        return longest_valid_token
+        longest_length = 0
+        for pattern in (self.__range_pattern, self.__pattern, NUMBER_PATTERN):
+            match = pattern.match(expression, start_index)
+            if match:
+                longest_length = max(longest_length, match.end() - start_index)
+        max_operator_length = min(self.__max_operator_length, len(expression) - start_index)
+        for length in range(max_operator_length, longest_length, -1):
+            if self.__is_operator(expression[start_index:start_index + length]):
+                return length
+        return longest_length
 
     def __tokenize(self, expression: str) -> List[str]:
         """
-        Converts the expression into a list of valid tokens.
+        Converts the expression into a list of valid tokens, in a single left-to-right scan.
+        Whitespace is consumed but not emitted, since it carries no meaning in the expression.
+        Brackets are single-character tokens, and any other token is the longest operand or operator that starts at
+        the current position.
         :param expression: The expression to tokenize.
-        :return: A list of strings where each string is a valid token in the expression.
+        :return: A list of strings where each string is a valid non-whitespace token in the expression.
         :raises ParserException: If an invalid token is found in the expression.
         """
         index = 0
         tokens = []
         while index < len(expression):
-            token = self.__find_next_matching_token(expression, index)
-            if not token:
+            char = expression[index]
+            if char.isspace():
+                index += 1
+                continue
+            if self.__is_bracket(char):
+                tokens.append(char)
+                index += 1
+                continue
+            token_length = self.__match_token_length(expression, index)
+            if not token_length:
                 raise ParserException(f"Could not find a valid token at index {index} of the expression.")
-            index += len(token)
-            tokens.append(token)
+            tokens.append(expression[index:index + token_length])
+            index += token_length
         return tokens
 
     @staticmethod
     def __are_parentheses_pairs(open_bracket: str, close_bracket: str) -> bool:
         """Returns whether an open bracket matches a closing bracket."""
-        return any([(open_bracket == "{" and close_bracket == "}"),
-                    (open_bracket == "(" and close_bracket == ")"),
-                    (open_bracket == "[" and close_bracket == "]")])
+        return _BRACKET_PAIRS.get(open_bracket) == close_bracket
 
     @staticmethod
-    def __does_have_higher_precedence(operator1: MathOperator, operator2: MathOperator) -> bool:
+    def __pop_precedence_threshold(operator: MathOperator) -> int:
         """
-        Determines if the second (current) operator has higher precedence than the first (previous) operator.
-        This is dependent on the operator's associativity and precedence.
-        If the second operator is left-to-right associative and its precedence is less than or equal to that of the
-        first, or if the second operator is right-to-left associative and its precedence is less than that of the first,
-        then the second operator is considered to have higher precedence.
-
-        :param operator1: The first operator (previously on the stack).
-        :param operator2: The second operator (currently being considered).
-        :return: True if the second operator has higher precedence, False otherwise.
+        Returns the minimal precedence of a stacked operator that must be popped before the given (current) operator
+        is pushed to the operators stack.
+        A left-to-right associative operator pops stacked operators with a precedence greater than or equal to its own,
+        while a right-to-left associative operator pops only stacked operators with a strictly greater precedence.
+
+        :param operator: The operator currently being considered.
+        :return: The precedence threshold for popping stacked operators.
         """
-        return (operator2.associativity == Associativity.LTR and operator2.precedence <= operator1.precedence) or (
-                operator2.associativity == Associativity.RTL and operator2.precedence < operator1.precedence)
+        if operator.associativity == Associativity.LTR:
+            return operator.precedence
+        return operator.precedence + 1
 
-    def __postfix(self, tokens: List[str]) -> List[Union[MathOperator, str]]:
+    def __parse_tokens(self, tokens: List[str]) -> Node:
         """
-        Converts a list of tokens representing an algebraic expression into its postfix form.
-        This method handles operator precedence, associativity, and parentheses.
-        It ensures that operators with higher precedence are placed before operators with lower precedence in the output
-         list. Parentheses are handled to enforce the proper ordering and grouping of operations.
+        Converts a list of tokens representing an algebraic expression into its syntax tree, in a single pass.
+        This method follows the shunting-yard algorithm, and handles operator precedence, associativity, and
+        parentheses. Instead of collecting the tokens in a postfix list and scanning it again to build the tree, every
+        token is turned into a node at the moment it would have been appended to the postfix list (see
+        __push_output), so the operands stack holds the subtrees built so far.
         :param tokens: A list of strings representing the tokens of an algebraic expression.
-        :return: A list containing the tokens of the expression arranged in postfix notation.
+        :return: The root node of the syntax tree representing the expression.
         :raises ParserException: If the expression contains syntax errors such as unbalanced parentheses,
                                  two operands in a row without an operator, or an open bracket directly following an
                                   operand. It also checks if the expression ends with an operand.
         """
         if not tokens:
             raise ParserException("List of tokens is empty.")
-        tokens_postfix: List[Union[MathOperator, str, float]] = []  # The returned tokens in a postfix order.
+        operands: List[Node] = []  # Stores the subtrees built so far, in the order of the postfix notation.
         operators_stack: List[Union[MathOperator, str]] = []  # Stores Operator instances, and parentheses strings.
-        # Filter spaces from the tokens list.
-        filtered_tokens: List[str] = [token for token in tokens if not token.isspace()]
         # Initializing state of previous token.
         is_prev_operand = False
         is_prev_open_bracket = False
-        # Updating the postfix tokens list and the operator stack for each given token.
+        # Updating the operands and the operator stack for each given token.
         token_index = 0
-        while token_index < len(filtered_tokens):
-            is_prev_operand, is_prev_open_bracket, token_index = self.__process_token_postfix(token_index,
-                                                                                              filtered_tokens,
-                                                                                              operators_stack,
-                                                                                              tokens_postfix,
-                                                                                              is_prev_operand,
-                                                                                              is_prev_open_bracket)
+        while token_index < len(tokens):
+            is_prev_operand, is_prev_open_bracket, token_index = self.__process_token(token_index,
+                                                                                      tokens,
+                                                                                      operators_stack,
+                                                                                      operands,
+                                                                                      is_prev_operand,
+                                                                                      is_prev_open_bracket)
         # Handling the remaining tokens in the stack.
         while operators_stack:
             operator: Union[MathOperator, str] = operators_stack.pop()
             if isinstance(operator, str) and self.__is_bracket(operator):
                 raise ParserException("Operator stack should not contain any brackets at this point!")
-            tokens_postfix.append(operator)
+            self.__push_output(operator, operands)
         if not is_prev_operand:
             raise ParserException("The expression must end with an operand.")
-        return tokens_postfix
+        return operands.pop()
 
-    def __process_token_postfix(self, token_index: int, tokens: List[str],
-                                operators_stack: List[Union[MathOperator, str]],
-                                tokens_postfix: List[Union[MathOperator, str, float]],
-                                is_previous_token_operand: bool,
-                                is_previous_token_open_bracket: bool) -> Tuple[bool, bool, int]:
+    @staticmethod
+    def __push_output(token: Union[MathOperator, str, float], operands: List[Node]) -> None:
+        """
+        Outputs a token of the expression in postfix order, by building its node and pushing it to the operands stack.
+        An operator node takes its operands from the top of the stack.
+        :param token: An operand (location, range or number) or an operator popped from the operators stack.
+        :param operands: The stack of subtrees built so far.
+        :raises ParserException: If an operator doesn't have enough operands.
         """
-        Processes a single token in the postfix logic.
+        node = Node(token)
+        if isinstance(token, (UnaryOperator, RangeOperator)):
+            if len(operands) < 1:
+                raise ParserException("Unary operator has no operand.")
+            node.right = operands.pop()
+        elif isinstance(token, BinaryOperator):
+            if len(operands) < 2:
+                raise ParserException("Binary operator doesn't have 2 operands.")
+            node.right = operands.pop()
+            node.left = operands.pop()
+        operands.append(node)
+
+    def __process_token(self, token_index: int, tokens: List[str],
+                        operators_stack: List[Union[MathOperator, str]],
+                        operands: List[Node],
+                        is_previous_token_operand: bool,
+                        is_previous_token_open_bracket: bool) -> Tuple[bool, bool, int]:
+        """
+        Processes a single token in the shunting-yard logic.
         :param token_index: index of the current token in the tokens list.
         :param tokens: The list of tokens in the formula.
         :param operators_stack: A stack (implemented as a list) holding operators and parentheses during conversion.
-        :param tokens_postfix: The list accumulating the postfix representation tokens.
+        :param operands: The stack of subtrees built so far.
         :param is_previous_token_operand: Flag indicating if the preceding token in the sequence was an operand.
         :param is_previous_token_open_bracket: Flag indicating if the preceding token was an open bracket.
         :return: 2 bool variables that indicate whether the current token is an operand (or a close bracket of an
@@ -241,63 +267,72 @@ class ExpressionParser:
         if self.__is_close_bracket(token):
             if is_previous_token_open_bracket:
                 raise ParserException("Empty brackets are not allowed")
-            self.__handle_close_bracket(token, operators_stack, tokens_postfix)
+            self.__handle_close_bracket(token, operators_stack, operands)
             return True, False, token_index + 1
         if self.__is_operator(token):
             operator = self.__find_operator(token, is_previous_token_operand)
             if operator is None:
                 raise ParserException("Invalid operator in expression.")
             if isinstance(operator, RangeOperator):
-                self.__handle_range_func(operator, token_index, tokens, tokens_postfix)
+                self.__handle_range_func(operator, token_index, tokens, operands)
                 token_index += 4
                 return True, False, token_index
             else:
-                self.__handle_operator(operator, operators_stack, tokens_postfix)
+                self.__handle_operator(operator, operators_stack, operands)
                 return False, False, token_index + 1
-        if self.__is_number(token):
+        if is_number(token):
             if is_previous_token_operand:
                 raise ParserException("Cannot have two operands in a row.")
-            tokens_postfix.append(float(token))
+            operands.append(Node(float(token)))
             return True, False, token_index + 1
         if self.__is_location(token):
             if is_previous_token_operand:
                 raise ParserException("Cannot have two operands in a row.")
-            tokens_postfix.append(token)
+            operands.append(Node(token))
             return True, False, token_index + 1
         raise ParserException(f"Invalid token in expression: {token}")
 
     def __handle_close_bracket(self, close_bracket: str, operators_stack: List[Union[MathOperator, str]],
-                               tokens_postfix: List[Union[MathOperator, str]]) -> None:
+                               operands: List[Node]) -> None:
         """
-        Handles the logic when a closing bracket is encountered during the conversion of an expression to postfix
-        notation.
+        Handles the logic when a closing bracket is encountered during the parsing of an expression.
+        The operators stacked since the matching open bracket are output, from the top of the stack downwards.
         :param close_bracket: A close bracket token string.
         :param operators_stack: The stack currently storing operators and open brackets.
-        :param tokens_postfix: The current postfix token list being constructed.
+        :param operands: The stack of subtrees built so far.
         :raises ParserException: If there is a mismatched parenthesis.
         """
-        current_brackets_remaining_operators = []
-        while operators_stack and not self.__is_open_bracket(operators_stack[-1]):
-            current_brackets_remaining_operators.append(operators_stack.pop())
-        if len(operators_stack) == 0:
+        open_bracket_index = len(operators_stack) - 1
+        while open_bracket_index >= 0 and not self.__is_open_bracket(operators_stack[open_bracket_index]):
+            open_bracket_index -= 1
+        if open_bracket_index < 0:
             raise ParserException("No open bracket found.")
-        open_bracket = operators_stack.pop()
-        if not self.__are_parentheses_pairs(open_bracket, close_bracket):
+        if not self.__are_parentheses_pairs(operators_stack[open_bracket_index], close_bracket):
             raise ParserException("Mismatched parentheses in expression.")
-        tokens_postfix.extend(current_brackets_remaining_operators)
+        for operator in reversed(operators_stack[open_bracket_index + 1:]):
+            self.__push_output(operator, operands)
+        del operators_stack[open_bracket_index:]
 
     def __handle_operator(self, operator: MathOperator, operators_stack: List[Union[MathOperator, str]],
-                          tokens_postfix: List[Union[MathOperator, str]]) -> None:
+                          operands: List[Node]) -> None:
         """
-        Handles the logic when an operator is encountered during the conversion of an expression to postfix notation.
+        Handles the logic when an operator is encountered during the parsing of an expression.
         This includes applying the operator precedence rules.
+        The stacked operators that should be popped form a suffix of the stack, so the suffix is found first, output,
+        and then removed from the stack in a single slice operation.
         :param operator: The operator encountered.
         :param operators_stack: The stack currently storing operators and open brackets.
-        :param tokens_postfix: The current postfix token list being constructed.
+        :param operands: The stack of subtrees built so far.
         """
-        while operators_stack and isinstance(operators_stack[-1], MathOperator) and self.__does_have_higher_precedence(
-                operators_stack[-1], operator):
-            tokens_postfix.append(operators_stack.pop())
+        threshold = self.__pop_thresholds[operator]
+        stacked_precedences = self.__stacked_precedences
+        drain_start = len(operators_stack)
+        while drain_start > 0 and stacked_precedences[operators_stack[drain_start - 1]] >= threshold:
+            drain_start -= 1
+        # Popped operators are output from the top of the stack downwards.
+        for stacked_operator in reversed(operators_stack[drain_start:]):
+            self.__push_output(stacked_operator, operands)
+        del operators_stack[drain_start:]
         operators_stack.append(operator)
 
     def __find_operator(self, token: str, is_previous_character_operand: bool) -> Optional[MathOperator]:
@@ -307,13 +342,11 @@ class ExpressionParser:
         :param is_previous_character_operand: Indicates whether the previous token is an operand (determines unary/binary).
         :return: The Operator object if found, None otherwise.
         """
-        filtered_operators = [op for op in self.__operators if op.symbol == token]
-
-        range_op = next((op for op in filtered_operators if isinstance(op, RangeOperator)), None)
+        range_op = self.__operators_table.get((token, RangeOperator))
         if range_op is not None:
             return range_op
-        binary_op = next((op for op in filtered_operators if isinstance(op, BinaryOperator)), None)
-        unary_op = next((op for op in filtered_operators if isinstance(op, UnaryOperator)), None)
+        binary_op = self.__operators_table.get((token, BinaryOperator))
+        unary_op = self.__operators_table.get((token, UnaryOperator))
         return binary_op if is_previous_character_operand and binary_op else unary_op
 
     def syntax_tree(self, expression: str) -> Node:
@@ -323,39 +356,27 @@ class ExpressionParser:
         :return: The root node of the syntax tree representing the given expression.
         :raises ParserException: If the expression is invalid or cannot be parsed into a valid syntax tree.
         """
-        tokens = self.__tokenize(expression)
-        postfix: List[Union[str, MathOperator]] = self.__postfix(tokens)
-        if len(postfix) == 0:
-            raise ParserException("Postfix list is empty!")
-        stack = []
-        for token in postfix:
-            node = Node(token)
-            if isinstance(token, MathOperator):
-                if isinstance(token, (UnaryOperator, RangeOperator)):
-                    if len(stack) < 1:
-                        raise ParserException("Unary operator has no operand.")
-                    node.right = stack.pop()
-                elif isinstance(token, BinaryOperator):
-                    if len(stack) < 2:
-                        raise ParserException("Binary operator doesn't have 2 operands.")
-                    node.right = stack.pop()
-                    node.left = stack.pop()
-            stack.append(node)
-        return stack.pop()
+        # Fast path for the most common formulas, which are a single number or a single location (e.g. "=A1").
+        stripped_expression = expression.strip()
+        if is_number(stripped_expression):
+            return Node(float(stripped_expression))
+        if self.__is_location(stripped_expression):
+            return Node(stripped_expression)
+        return self.__parse_tokens(self.__tokenize(expression))
 
     def __handle_range_func(self, operator: RangeOperator, token_index: int, tokens: List[str],
-                            tokens_postfix: List[Union[MathOperator, str]]) -> None:
+                            operands: List[Node]) -> None:
         """
-       Validates and appends a range function to the postfix tokens list.
+       Validates and outputs a range function.
 
        Ensures the range function, starting at `token_index`, follows the correct structure:
-       an opening bracket, a valid range token, and a closing bracket. If valid, appends the
-       range token and its operator to `tokens_postfix`.
+       an opening bracket, a valid range token, and a closing bracket. If valid, pushes the
+       operator node, applied to the range token, to `operands`.
 
        :param operator: The RangeOperator to process.
        :param token_index: Index of the range operator in `tokens`.
        :param tokens: List of all tokens from the expression.
-       :param tokens_postfix: Postfix tokens list being populated.
+       :param operands: The stack of subtrees built so far.
        :raises ParserException: If the range function format is incorrect or tokens are missing.
        """
         if token_index > len(tokens) - 4:
@@ -363,7 +384,6 @@ class ExpressionParser:
         open_bracket, range_token, close_bracket = tokens[token_index + 1: token_index + 4]
         if all([self.__is_open_bracket(open_bracket), self.__is_close_bracket(close_bracket),
                 self.__are_parentheses_pairs(open_bracket, close_bracket), self.__is_range_token(range_token)]):
-            tokens_postfix.append(range_token)
-            tokens_postfix.append(operator)
+            operands.append(Node(operator, right=Node(range_token)))
         else:
             raise ParserException("Bad range function call format.")
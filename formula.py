@@ -0,0 +1,54 @@
+from enum import Enum, auto
+from typing import Tuple, Any, FrozenSet, Hashable
+
+
+class Opcode(Enum):
+    """
+    Enumerates the instructions of a compiled formula, which runs on a stack of values.
+
+    - PUSH_NUMBER: Pushes a constant number (the argument).
+    - PUSH_CELL: Pushes the value of the cell in the position given as the argument.
+    - APPLY_UNARY: Replaces the top value with the result of the unary operator function given as the argument.
+    - APPLY_BINARY: Replaces the 2 top values with the result of the binary operator function given as the argument.
+    - APPLY_RANGE: Pushes the result of a range operator, given as a (function, range positions) argument.
+    """
+    PUSH_NUMBER = auto()
+    PUSH_CELL = auto()
+    APPLY_UNARY = auto()
+    APPLY_BINARY = auto()
+    APPLY_RANGE = auto()
+
+
+Instruction = Tuple[Opcode, Any]
+
+
+class Formula:
+    """
+    A cell formula, compiled from its syntax tree into a flat program in postfix order.
+    Running the instructions one after the other on a stack computes the formula value, so evaluating it does not
+    require a recursive walk over the tree.
+    The positions the formula depends on are collected once, while compiling, so they don't need to be recomputed on
+    every update of the dependency graph.
+    """
+    __slots__ = ("__instructions", "__dependencies")
+
+    def __init__(self, instructions: Tuple[Instruction, ...], dependencies: FrozenSet[Hashable]):
+        """
+        Initializes the Formula with its compiled program.
+        :param instructions: The (opcode, argument) pairs of the program, in postfix order.
+        :param dependencies: The positions of all the cells the formula references (directly or as part of a range).
+        """
+        self.__instructions: Tuple[Instruction, ...] = instructions
+        self.__dependencies: FrozenSet[Hashable] = dependencies
+
+    def get_instructions(self) -> Tuple[Instruction, ...]:
+        """
+        Returns the compiled program of the formula.
+        """
+        return self.__instructions
+
+    def get_dependencies(self) -> FrozenSet[Hashable]:
+        """
+        Returns the positions of all the cells the formula references.
+        """
+        return self.__dependencies
@@ -25,6 +25,10 @@ class MathOperator:
     Methods:
         calculate: Should be implemented by subclasses to perform the operation.
     """
+    # Operators are read in the parser's inner loops, so they are stored in fixed slots rather than a per-instance dict.
+    # Subclasses declare empty slots to keep this layout.
+    __slots__ = ("symbol", "precedence", "associativity")
+
     def __init__(self, symbol: str, precedence: int, associativity: Associativity):
         self.symbol = symbol
         self.precedence = precedence
@@ -43,6 +47,8 @@ class UnaryOperator(MathOperator):
     must implement the calculation logic specific to the unary operation.
     Inherits from MathOperator.
    """
+    __slots__ = ()
+
     def __init__(self, symbol: str, precedence: int = 3, associativity: Associativity = Associativity.RTL):
         super().__init__(symbol, precedence, associativity)
 
@@ -60,6 +66,8 @@ class BinaryOperator(MathOperator):
 
     Inherits from MathOperator.
     """
+    __slots__ = ()
+
     def __init__(self, symbol: str, precedence: int = 1, associativity: Associativity = Associativity.LTR):
         super().__init__(symbol, precedence, associativity)
 
@@ -77,6 +85,8 @@ class RangeOperator(MathOperator):
 
     Inherits from MathOperator.
     """
+    __slots__ = ()
+
     def __init__(self, symbol: str, precedence: int = 3, associativity: Associativity = Associativity.RTL):
         super().__init__(symbol, precedence, associativity)
 
@@ -90,6 +100,8 @@ class RangeOperator(MathOperator):
 # Implementing specific operators
 
 class Plus(BinaryOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("+", 1)
 
@@ -98,6 +110,8 @@ class Plus(BinaryOperator):
 
 
 class Minus(BinaryOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("-", 1)
 
@@ -106,6 +120,8 @@ class Minus(BinaryOperator):
 
 
 class Times(BinaryOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("*", 2)
 
@@ -114,6 +130,8 @@ class Times(BinaryOperator):
 
 
 class Divide(BinaryOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("/", 2)
 
@@ -122,6 +140,8 @@ class Divide(BinaryOperator):
 
 
 class Power(BinaryOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("^", 4, Associativity.RTL)
 
@@ -130,6 +150,8 @@ class Power(BinaryOperator):
 
 
 class Negate(UnaryOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("-", 3)
 
@@ -138,6 +160,8 @@ class Negate(UnaryOperator):
 
 
 class Sin(UnaryOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("sin", 3)
 
@@ -146,6 +170,8 @@ class Sin(UnaryOperator):
 
 
 class Max(RangeOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("max")
 
@@ -154,6 +180,8 @@ class Max(RangeOperator):
 
 
 class Min(RangeOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("min")
 
@@ -162,6 +190,8 @@ class Min(RangeOperator):
 
 
 class Sum(RangeOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("sum")
 
@@ -170,6 +200,8 @@ class Sum(RangeOperator):
 
 
 class Average(RangeOperator):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("average")
 
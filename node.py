@@ -1,4 +1,4 @@
-from typing import Optional, Union, Generator
+from typing import Optional, Union
 
 from math_operator import MathOperator
 
@@ -15,6 +15,9 @@ class Node:
         left (Optional[Node]): A reference to the left child Node.
         right (Optional[Node]): A reference to the right child Node.
     """
+    # A node is created for every token of every parsed formula, so it is stored in fixed slots.
+    __slots__ = ("value", "left", "right")
+
     def __init__(self, value: Union[MathOperator, float, str], left: Optional["Node"] = None,
                  right: Optional["Node"] = None) -> None:
         self.value: Union[MathOperator, float, str] = value
@@ -37,19 +40,3 @@ class Node:
         :return: True if the node has no left or right child, False otherwise.
         """
         return self.left is None and self.right is None
-
-    def preorder(self) -> Generator["Node", None, None]:
-        """
-        Generates the nodes in a preorder traversal starting from this node.
-
-        Yields the current node, then recursively yields from the left and right
-        children (if they exist), providing a way to iterate through the tree nodes
-        in preorder.
-
-        :return: A generator yielding Node instances in preorder.
-        """
-        yield self  # Yield the current node
-        if self.left is not None:
-            yield from self.left.preorder()  # Recursively yield from left subtree
-        if self.right is not None:
-            yield from self.right.preorder()  # Recursively yield from right subtree
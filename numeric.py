@@ -0,0 +1,30 @@
+import re
+from typing import Optional
+
+# An unsigned decimal number, optionally followed by an exponent (e.g. "3", "1.5", ".5", "2e-3").
+NUMBER_PATTERN: re.Pattern = re.compile(r"(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?")
+# A number as written in a cell: optionally signed, and possibly wrapped with whitespace (as float() allows).
+_CELL_NUMBER_PATTERN: re.Pattern = re.compile(rf"\s*[+-]?(?:{NUMBER_PATTERN.pattern})\s*")
+
+
+def is_number(value: str) -> bool:
+    """
+    Checks whether a string is an unsigned decimal number token.
+    Signs and surrounding whitespace are not part of a number token (they should be considered as multiple tokens).
+    """
+    return NUMBER_PATTERN.fullmatch(value) is not None
+
+
+def try_parse_number(value: str) -> Optional[float]:
+    """
+    Attempts to convert the content of a cell to a float; returns None if it is not a decimal number.
+    The content is prescreened with a precompiled pattern, so for typical non-numeric content (formulas and text) no
+    exception is raised and caught.
+    """
+    if _CELL_NUMBER_PATTERN.fullmatch(value) is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        # The pattern's whitespace class is wider than the one of float() (e.g. the "\x1c" - "\x1f" separators).
+        return None
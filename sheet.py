@@ -1,23 +1,52 @@
 import csv
+import functools
 import json
+import math
+import operator
 import re
-from typing import Dict, Tuple, Union, Optional, List, Set
-
-import networkx as nx
+from typing import Dict, Tuple, Union, Optional, List, Set, FrozenSet, Callable, Type
 
 from cell import Cell
+from dependency_graph import DependencyGraph
 from exceptions import CircularDependenciesException, ParserException, EvaluationException, BadNameException, \
     SheetLoadException
 from expression_parser import ExpressionParser
 from failure_reason import FailureReason
-from math_operator import Plus, Minus, Times, Divide, Negate, Sin, Power, MathOperator, UnaryOperator, BinaryOperator, \
-    Max, Min, Sum, Average, RangeOperator
+from formula import Formula, Opcode, Instruction
+from math_operator import Plus, Minus, Times, Divide, Negate, Sin, Power, UnaryOperator, BinaryOperator, \
+    Max, Min, Sum, Average, RangeOperator, MathOperator
 from node import Node
+from numeric import try_parse_number
 
 Position = Tuple[int, int]  # (Row Index, Column Index)
-Content = Union[str, float, Node]
+Content = Union[str, float, Formula]
 Value = Union[str, float]
 
+# Column names consts.
+_NUMBER_OF_LETTERS = 26
+_A_ASCII = 65
+# Row numbers consts.
+_DECIMAL_BASE = 10
+_ZERO_ASCII = 48
+
+
+def _compute_column_name(col_index: int) -> str:
+    """Computes the name of a column as a bijective base-26 number ("A" is 0, "Z" is 25, "AA" is 26)."""
+    name = ""
+    while col_index >= 0:
+        # Letters are computed from the least significant one, so each letter is prepended.
+        name = chr(col_index % _NUMBER_OF_LETTERS + _A_ASCII) + name
+        col_index = col_index // _NUMBER_OF_LETTERS - 1
+    return name
+
+
+def _compute_column_index(column_name: str) -> int:
+    """Computes the 0 based index of a column from its name (the inverse of _compute_column_name)."""
+    index = 0
+    for char in column_name:
+        index = index * _NUMBER_OF_LETTERS + ord(char) - _A_ASCII + 1
+    return index - 1
+
 
 class Sheet:
     """
@@ -31,16 +60,18 @@ class Sheet:
 
     Attributes:
         __EQUATION_PREFIX (str): Prefix indicating a string should be interpreted as a formula.
-        __NUMBER_OF_LETTERS (int): Used for converting column letters to indices.
-        __A_ASCII (int): ASCII value of 'A', used as a base for column letter to index conversions.
         __CELL_PATTERN (re.Pattern): Regex pattern to validate and parse cell references.
         __RANGE_NAME_PATTERN (re.Pattern): Regex pattern for validating and parsing cell range references.
         ROWS_NUM (int): Number of rows in the spreadsheet.
         COLUMNS_NUM (int): Number of columns in the spreadsheet.
+        __COLUMN_NAMES (Tuple[str, ...]): The column names of the spreadsheet, by column index.
+        __COLUMN_INDEXES (Dict[str, int]): The column index of each column name of the spreadsheet.
         __parser (ExpressionParser): Parser for evaluating cell formulas.
+        __parse_formula (Callable[[str], Node]): The parser's syntax_tree, memoized by the formula string.
         __cells (Dict[Position, Cell]): Mapping from cell positions to Cell objects.
         __cells_values (Dict[Position, Value]): Cache of evaluated cell values.
-        __dependencies_graph (nx.DiGraph): Directed graph tracking dependencies between cells to manage formula evaluations.
+        __dependencies_graph (DependencyGraph): Directed graph tracking dependencies between cells to manage formula
+            evaluations.
 
     The class supports dynamic cell content updates, including direct values and formulas. Formulas can reference
     other cells and include built-in operations and functions. The spreadsheet automatically recalculates dependent
@@ -58,27 +89,47 @@ class Sheet:
     fixed dimensions.
     """
     __EQUATION_PREFIX = "="
-    # Column names consts.
-    __NUMBER_OF_LETTERS = 26
-    __A_ASCII = 65
     # Storing compiled regex patterns (identical in the class level), and regex groups to query later.
     # Cell pattern.
-    __CELL_PATTERN: re.Pattern = re.compile("^(?P<column>[A-Z]+)(?P<row>[0-9]+)$")
-    __COLUMN_PATTERN_GROUP = "column"
-    __ROW_PATTERN_GROUP = "row"
+    __CELL_PATTERN: re.Pattern = re.compile("(?P<column>[A-Z]+)(?P<row>[0-9]+)")
     # Cells range pattern.
-    __RANGE_NAME_PATTERN: re.Pattern = re.compile("^(?P<col1>[A-Z]+)(?P<row1>[0-9]+):(?P<col2>[A-Z]+)(?P<row2>[0-9]+)$")
+    __RANGE_NAME_PATTERN: re.Pattern = re.compile("(?P<col1>[A-Z]+)(?P<row1>[0-9]+):(?P<col2>[A-Z]+)(?P<row2>[0-9]+)")
     __COL1_GROUP = "col1"
     __COL2_GROUP = "col2"
     __ROW1_GROUP = "row1"
     __ROW2_GROUP = "row2"
 
+    # Built-in implementations of the operators, which compiled formulas call directly instead of the operators'
+    # calculate methods. Operators that are missing here are applied through their calculate method.
+    __OPERATOR_FUNCTIONS: Dict[Type[MathOperator], Callable] = {
+        Plus: operator.add,
+        Minus: operator.sub,
+        Times: operator.mul,
+        Divide: operator.truediv,
+        Power: math.pow,
+        Negate: operator.neg,
+        Sin: math.sin,
+        Max: max,
+        Min: min,
+        Sum: sum,
+    }
+
+    # The number of distinct formulas whose syntax trees are kept for reuse.
+    __PARSED_FORMULAS_CACHE_SIZE = 1024
+    # The number of distinct cell names whose positions are kept for reuse. The cache is bounded, since names come
+    # from user input, and leading zeros make unlimited distinct valid names ("A1", "A01", "A001"...).
+    __CELL_NAMES_CACHE_SIZE = 65536
+    # The number of distinct range names whose positions are kept for reuse (bounded for the same reason).
+    __RANGE_NAMES_CACHE_SIZE = 4096
     # Storage consts.
     __CSV_EXTENSION = '.csv'
     __JSON_EXTENSION = '.json'
     # The sheet currently support a fixed size that usually fits a laptop screen.
     ROWS_NUM: int = 20
     COLUMNS_NUM: int = 10
+    # The names of the sheet columns and their inverse mapping, computed once so conversions are a single lookup.
+    __COLUMN_NAMES: Tuple[str, ...] = tuple(map(_compute_column_name, range(COLUMNS_NUM)))
+    __COLUMN_INDEXES: Dict[str, int] = {name: index for index, name in enumerate(__COLUMN_NAMES)}
 
     def __init__(self, json_file: Optional[str] = None):
         """
@@ -90,9 +141,12 @@ class Sheet:
         self.__parser = ExpressionParser(math_operators=[Plus(), Minus(), Times(), Divide(), Negate(), Sin(), Power(),
                                                          Max(), Min(), Sum(), Average()],
                                          var_pattern=self.__CELL_PATTERN, range_pattern=self.__RANGE_NAME_PATTERN)
+        # Syntax trees are never modified after parsing, so cells with the same formula can share a single tree.
+        # Invalid formulas raise, and are therefore not cached.
+        self.__parse_formula = functools.lru_cache(maxsize=self.__PARSED_FORMULAS_CACHE_SIZE)(self.__parser.syntax_tree)
         self.__cells: Dict[Position, Cell] = {}
         self.__cells_values: Dict[Position, Value] = {}  # Allows retrieving values without reevaluation.
-        self.__dependencies_graph = nx.DiGraph()  # Stores the dependencies between cells (formulas).
+        self.__dependencies_graph = DependencyGraph()  # Stores the dependencies between cells (formulas).
         if json_file is not None:
             # Raises errors to caller.
             data: Dict[Position, str] = self.__load_data_from_json(json_file)
@@ -106,26 +160,17 @@ class Sheet:
         Takes into consideration graph cycles and evaluation by the reverse topological order of the dependencies,
         i.e. evaluating each item only after its dependencies are evaluated.
         """
-        dependency_graph = nx.DiGraph()
+        dependency_graph = DependencyGraph()
         for position, cell in cells.items():
             content = cell.get_parsed_content()
-            dependencies = self.__get_dependencies(content) if isinstance(content, Node) else set()
-            graph_edges = [(position, dependency) for dependency in dependencies]
-            dependency_graph.add_edges_from(graph_edges)
-            try:
-                list(nx.topological_sort(dependency_graph))
-            except nx.NetworkXUnfeasible:
-                raise CircularDependenciesException("Cycle detected, new edges not added.")
-        for position in cells.keys():
-            # Adding all positions given, so all cells weill be evaluated, even if they don't have any dependencies.
-            # Will remove isolates from graph later.
-            dependency_graph.add_node(position)
+            if isinstance(content, Formula):
+                # Raises CircularDependenciesException if the new edges close a cycle.
+                dependency_graph.set_dependencies(position, content.get_dependencies())
         # Each item depends only on previous items in the order. There are no cycles at this point.
-        reverse_topological_order: List[Position] = list(nx.topological_sort(dependency_graph.reverse()))
         values: Dict[Position, Value] = {}
-        for position in reverse_topological_order:
-            values[position] = self.__evaluate_position(position, values)
-        self.__remove_isolates(dependency_graph)
+        for position in dependency_graph.evaluation_order(cells.keys()):
+            content = cells[position].get_parsed_content()
+            values[position] = self.__evaluate(content, values) if isinstance(content, Formula) else content
         return dependency_graph, values
 
     def get_cell_content(self, row_index: int, column_index: int) -> Optional[str]:
@@ -151,11 +196,9 @@ class Sheet:
         """
         A string label representing the column, starting with "A".
         """
-        name = ""
-        while col_index >= 0:
-            name += chr(col_index % cls.__NUMBER_OF_LETTERS + cls.__A_ASCII)
-            col_index = col_index // cls.__NUMBER_OF_LETTERS - 1
-        return name
+        if 0 <= col_index < len(cls.__COLUMN_NAMES):
+            return cls.__COLUMN_NAMES[col_index]
+        return _compute_column_name(col_index)
 
     def get_cell_name(self, col_index: int, row_index: int) -> str:
         """
@@ -181,29 +224,10 @@ class Sheet:
             current_position: Position = (row_index, col_index)
             content: Content = self.__parse_content(written_content)
 
-            # Compute dependents to update, and validate no cycles in the dependency graph.
-            updated_position_dependencies = self.__get_dependencies(content) if isinstance(content, Node) else set()
-            new_dependency_graph: nx.DiGraph = self.__get_updated_graph(current_position, updated_position_dependencies)
-            dependents_to_reevaluate: List[Position] = self.__compute_dependencies(current_position,
-                                                                                   new_dependency_graph)
-
-            # If new content is empty, treat it as a delete operation.
-            if content == "":
-                self.__delete_position(current_position, dependents_to_reevaluate)
-                return True, {current_position: None}, None
-
-            # Evaluate / Reevaluate the current position value, then store the result in a caching dict.
-            cached_results: Dict[Position, Value] = {}
-            updated_value = self.__evaluate(content, cached_results) if isinstance(content, Node) else content
-            cached_results[current_position] = updated_value
-            positions_to_update: Dict[Position, Value] = {current_position: updated_value}
-            # Evaluating current position dependents according to the dependency graph order.
-            for position in dependents_to_reevaluate:
-                positions_to_update[position] = self.__evaluate_position(position, cached_results)
-            # If success - update the state of the dependency graph and the values cache.
-            self.__cells[current_position] = Cell(written_content, content)
-            self.__dependencies_graph = new_dependency_graph
-            self.__cells_values.update(positions_to_update)
+            # Update the dependency graph in place (validating no cycles are created), and roll it back on failure.
+            updated_position_dependencies = content.get_dependencies() if isinstance(content, Formula) else frozenset()
+            with self.__dependencies_graph.dependencies_transaction(current_position, updated_position_dependencies):
+                positions_to_update = self.__apply_update(current_position, written_content, content)
             return True, positions_to_update, None
 
         except BadNameException:
@@ -216,26 +240,79 @@ class Sheet:
             return False, {}, FailureReason.DEPENDENCIES_CYCLE
         except ZeroDivisionError:
             return False, {}, FailureReason.ZERO_DIVISION
-        except Exception:
+        except (ArithmeticError, ValueError, TypeError):
+            # Other math errors of the operators (e.g. a power that overflows, or a math domain error). Any other
+            # exception is a bug, and is not hidden behind a failed update.
             return False, {}, FailureReason.UNEXPECTED_EXCEPTION
 
-    def __get_dependencies(self, node: Node) -> Set[Position]:
+    def __apply_update(self, current_position: Position, written_content: str,
+                       content: Content) -> Dict[Position, Optional[Value]]:
+        """
+        Evaluates the updated position and its dependents, and stores the results if all the evaluations succeed.
+        The dependency graph should already contain the new dependencies of the updated position.
+        :return: The values to update in the GUI (a None value for a deleted cell).
+        :raises EvaluationException, BadNameException, ZeroDivisionError: If an evaluation fails.
+        """
+        # If new content is empty, treat it as a delete operation.
+        if content == "":
+            self.__delete_position(current_position)
+            return {current_position: None}
+
+        # Evaluate / Reevaluate the current position value, then store the result in a caching dict.
+        cached_results: Dict[Position, Value] = {}
+        updated_value = self.__evaluate(content, cached_results) if isinstance(content, Formula) else content
+        cached_results[current_position] = updated_value
+        positions_to_update: Dict[Position, Value] = {current_position: updated_value}
+        # Evaluating current position dependents according to the dependency graph order, so the dependencies of each
+        # dependent are settled before it is reached. A dependent is reevaluated only if one of its direct dependencies
+        # changed its value, and only the dependents with a changed value are updated.
+        changed_positions: Set[Position] = set()
+        if not self.__is_same_value(self.__cells_values.get(current_position), updated_value):
+            changed_positions.add(current_position)
+        # If the value didn't change, none of the dependents can change, so they are not even searched for.
+        dependents_to_reevaluate: List[Position] = \
+            self.__dependencies_graph.dependents_in_order(current_position) if changed_positions else []
+        for position in dependents_to_reevaluate:
+            if not self.__dependencies_graph.depends_on_any(position, changed_positions):
+                continue
+            # Dependents are always formulas, since they reference other cells.
+            value = self.__evaluate(self.__cells[position].get_parsed_content(), cached_results)
+            cached_results[position] = value
+            if not self.__is_same_value(self.__cells_values[position], value):
+                changed_positions.add(position)
+                positions_to_update[position] = value
+        # If success - update the values cache.
+        self.__cells[current_position] = Cell(written_content, content)
+        self.__cells_values.update(positions_to_update)
+        return positions_to_update
+
+    @staticmethod
+    def __is_same_value(previous_value: Optional[Value], value: Value) -> bool:
+        """
+        Returns whether a reevaluated value is identical to the previous value, so its dependents don't need to change.
+        Floats are also compared by their sign, since 0.0 and -0.0 are equal but displayed differently.
+        """
+        if isinstance(previous_value, float) and isinstance(value, float):
+            return previous_value == value and math.copysign(1.0, previous_value) == math.copysign(1.0, value)
+        return previous_value == value
+
+    @staticmethod
+    def __collect_dependencies(instructions: List[Instruction]) -> FrozenSet[Position]:
         """
-        Given a node, iterates over its string nodes returns set of positions.
-        :raises EvaluationException: If a cell name cannot be converted to a position.
+        Given the compiled instructions of a formula, returns the set of positions it references (directly or as part
+        of a range).
         """
         dependencies: Set[Position] = set()
-        for string_token in self.__get_string_nodes(node):
-            if self.__CELL_PATTERN.match(string_token):
-                dependencies.add(self.__cell_name_to_location(string_token))
-            elif self.__RANGE_NAME_PATTERN.match(string_token):
-                range_positions: Set[Position] = self.__calculate_range_positions(string_token)
-                dependencies.update(range_positions)
-        return dependencies
-
-    def __delete_position(self, position: Position, dependent_positions: List[Position]):
+        for opcode, argument in instructions:
+            if opcode is Opcode.PUSH_CELL:
+                dependencies.add(argument)
+            elif opcode is Opcode.APPLY_RANGE:
+                dependencies.update(argument[1])
+        return frozenset(dependencies)
+
+    def __delete_position(self, position: Position):
         """Deletes cell data from the sheet if it is not a dependency of any other cell. If it doesn't exist - skip."""
-        if dependent_positions:
+        if self.__dependencies_graph.has_dependents(position):
             raise EvaluationException("Cannot delete cell when another cell is dependent on it.")
         self.__cells.pop(position, None)  # Remove if exists.
         self.__cells_values.pop(position, None)  # Remove if exists.
@@ -245,45 +322,120 @@ class Sheet:
         Converts a string content of a cell in the sheet to a parsed value that can be evaluated.
         :raises ParserException: If the cell content is an invalid formula that cannot be parsed.
         """
-        number_result: Optional[float] = self.__try_parse_number(cell_content)
+        # Formulas are recognized by their prefix first, since they can never be numbers.
+        if cell_content.startswith(self.__EQUATION_PREFIX):
+            return self.__compile(self.__parse_formula(cell_content[1:]))  # Returns a compiled Formula.
+        number_result: Optional[float] = try_parse_number(cell_content)
         if number_result is not None:
             return number_result
-        if cell_content.startswith(self.__EQUATION_PREFIX):
-            return self.__parser.syntax_tree(cell_content[1:])  # Returns a Node of an expression tree.
         return cell_content  # When the content is a simple string.
 
+    def __compile(self, node: Node) -> Formula:
+        """
+        Compiles the syntax tree of a formula into a flat program in postfix order, that evaluates without recursion.
+        Cell references and ranges are converted to positions once here, instead of on every evaluation, and operators
+        applied only on constant numbers are folded into a single number.
+        :raises BadNameException: If a cell reference or a range is not valid in the sheet.
+        :raises EvaluationException: If the tree contains an unsupported node.
+        """
+        instructions: List[Instruction] = []
+        self.__compile_node(node, instructions)
+        return Formula(tuple(instructions), self.__collect_dependencies(instructions))
+
+    def __compile_node(self, root: Node, instructions: List[Instruction]) -> None:
+        """
+        Appends the instructions of the subtree rooted at the given node to the instructions list, in postfix order.
+        The tree is walked with an explicit stack instead of recursion, so deeply nested formulas don't reach the
+        recursion limit.
+        """
+        # Nodes to compile, each with whether its operands were already compiled (so the operator itself is next).
+        stack: List[Tuple[Node, bool]] = [(root, False)]
+        while stack:
+            node, operands_compiled = stack.pop()
+            if operands_compiled:
+                if isinstance(node.value, UnaryOperator):
+                    self.__append_operator(instructions, Opcode.APPLY_UNARY, self.__operator_function(node.value), 1)
+                else:
+                    self.__append_operator(instructions, Opcode.APPLY_BINARY, self.__operator_function(node.value), 2)
+            elif node.is_leaf():
+                if isinstance(node.value, float):
+                    instructions.append((Opcode.PUSH_NUMBER, node.value))
+                elif isinstance(node.value, str):
+                    instructions.append((Opcode.PUSH_CELL, self.__cell_name_to_location(node.value)))
+                else:
+                    raise EvaluationException(f"Invalid leaf value: {node.value}")
+            elif isinstance(node.value, RangeOperator):
+                if not (node.right is not None and isinstance(node.right.value, str) and node.left is None):
+                    raise EvaluationException("Problem evaluating a Range Operator node.")
+                # The range is constant, so its positions are computed once here, instead of on every evaluation.
+                range_positions: Tuple[Position, ...] = self.__calculate_range_positions(node.right.value)
+                instructions.append((Opcode.APPLY_RANGE, (self.__operator_function(node.value), range_positions)))
+            elif isinstance(node.value, UnaryOperator):
+                if node.right is None:
+                    raise EvaluationException("Missing operand for unary operator.")
+                stack.append((node, True))
+                stack.append((node.right, False))
+            elif isinstance(node.value, BinaryOperator):
+                if node.left is None or node.right is None:
+                    raise EvaluationException("Missing operands for binary operator.")
+                # The left operand is pushed last, so it is compiled first.
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+            else:
+                raise EvaluationException(f"Unsupported node value: {node.value}")
+
     @staticmethod
-    def __try_parse_number(value: str) -> Optional[float]:
+    def __append_operator(instructions: List[Instruction], opcode: Opcode, function: Callable, arity: int) -> None:
         """
-        Attempts to convert a string to a float; returns None if conversion fails.
+        Appends an operator instruction. If all of its operands are constant numbers, the operator is applied right away
+        and its operands are replaced with the result, so it doesn't run again on every evaluation.
+        Operators that fail on their constants (e.g. division by zero) are kept, to fail when the formula is evaluated.
         """
-        try:
-            return float(value)
-        except ValueError:
-            return None
+        operands: List[Instruction] = instructions[-arity:]
+        if len(operands) == arity and all(operand_opcode is Opcode.PUSH_NUMBER for operand_opcode, _ in operands):
+            try:
+                result: float = function(*(value for _, value in operands))
+            except (ArithmeticError, ValueError):
+                pass
+            else:
+                instructions[-arity:] = [(Opcode.PUSH_NUMBER, result)]
+                return
+        instructions.append((opcode, function))
 
-    @staticmethod
-    def __get_string_nodes(node: Node) -> List[str]:
+    @classmethod
+    def __operator_function(cls, math_operator: MathOperator) -> Callable:
         """
-        Collects all nodes in the tree where the value is of type str.
-        :return: A list of Nodes with string values.
+        Returns the function that applies the given operator - a built-in one when available, so evaluating a formula
+        doesn't go through the operator's calculate method.
         """
-        return [node.value for node in node.preorder() if isinstance(node.value, str)]
+        return cls.__OPERATOR_FUNCTIONS.get(type(math_operator), math_operator.calculate)
 
     @classmethod
+    @functools.lru_cache(maxsize=__CELL_NAMES_CACHE_SIZE)
     def __cell_name_to_location(cls, cell_name: str) -> Position:
         """
         Convert a cell name (like 'A1', 'B2', etc.) to its corresponding row and column indices.
-        :raises EvaluationException: If the cell name does not match the regular expression.
+        The name is validated and converted in a single scan over its characters (the same format as __CELL_PATTERN:
+        uppercase letters followed by digits). The conversions are also cached, since the same names are referenced
+        by many formulas and in loaded files.
+        :raises BadNameException: If the cell name is not in the cell name format, or is outside the sheet.
         :return: A tuple of a row index followed by a column index.
         """
-        match = cls.__CELL_PATTERN.match(cell_name)
-        if not match:
+        length = len(cell_name)
+        index = 0
+        column_number = 0  # 1 based.
+        while index < length and "A" <= cell_name[index] <= "Z":
+            column_number = column_number * _NUMBER_OF_LETTERS + ord(cell_name[index]) - _A_ASCII + 1
+            index += 1
+        row_start = index
+        row_number = 0  # 1 based.
+        while index < length and "0" <= cell_name[index] <= "9":
+            row_number = row_number * _DECIMAL_BASE + ord(cell_name[index]) - _ZERO_ASCII
+            index += 1
+        if row_start == 0 or index == row_start or index != length:
             raise BadNameException(f"Invalid cell name format: {cell_name}")
-        # Accessing named groups directly for better readability
-        column_part = match.group(cls.__COLUMN_PATTERN_GROUP)
-        row_part = match.group(cls.__ROW_PATTERN_GROUP)
-        position = (cls.__row_name_to_index(row_part), cls.__column_name_to_index(column_part))
+        position = (row_number - 1, column_number - 1)
         if not cls.__position_in_sheet_range(position):
             raise BadNameException("Cell indexes outside of range.")
         return position
@@ -294,141 +446,62 @@ class Sheet:
         return int(row_name) - 1
 
     @classmethod
-    def __column_name_to_index(cls, column_name: str):
-        """Compute Ascii value of each letter in the column name."""
-        column_ascii_list = [(ord(char) - cls.__A_ASCII) for char in column_name]
-        return sum([char_index * cls.__NUMBER_OF_LETTERS + char_ascii
-                    for (char_index, char_ascii) in enumerate(column_ascii_list)])
-
-    def __get_updated_graph(self, position: Position,
-                            position_dependencies: Optional[Set[Position]] = None) -> nx.DiGraph:
-        """
-        Return an updated graph with the new dependencies of the given position.
-        If the position_dependencies is not given, the position is updated to have no dependencies (e.g. float cell).
-        """
-        updated_edges: Set[(Position, Position)] = \
-            {(position, d) for d in position_dependencies} if position_dependencies is not None else set()
-        # I edit a copy of the graph, so if there's an error I could revert to the original graph easily.
-        new_dependency_graph: nx.DiGraph = self.__dependencies_graph.copy()
-        # Update new dependencies and remove deleted dependencies from the temporary graph.
-        new_dependency_graph.remove_edges_from(list(new_dependency_graph.out_edges(position)))
-        new_dependency_graph.add_edges_from(updated_edges)
-        self.__remove_isolates(new_dependency_graph)
-        return new_dependency_graph
-
-    @staticmethod
-    def __remove_isolates(dependency_graph: nx.DiGraph):
-        """Find all isolated items (nodes with no edges) and remove them, since they no longer have any meaning."""
-        isolated_items = list(nx.isolates(dependency_graph))
-        dependency_graph.remove_edges_from(isolated_items)
+    def __column_name_to_index(cls, column_name: str) -> int:
+        """
+        Convert a column name to its 0 based index ("A" is 0, "Z" is 25, "AA" is 26).
+        Names of columns outside the sheet are not in the lookup table, and are computed instead.
+        """
+        index = cls.__COLUMN_INDEXES.get(column_name)
+        if index is None:
+            return _compute_column_index(column_name)
+        return index
 
-    @staticmethod
-    def __compute_dependencies(current_position: Position, dependency_graph: nx.DiGraph) -> List[Position]:
+    def __evaluated_value(self, position: Position, evaluated_positions: Dict[Position, Value]) -> Value:
         """
-        Attempt a topological sort to check for cycles in the graph.
-        It allows use to iterate the dependency according to the dependency order in the graph.
-        :raises CircularDependenciesException: If there is a cycle in the graph.
-        :return: The list of dependencies to evaluate in order to estimate the current position,
-        and a list of the positions that are dependent on the current position, according to the topological-sort order.
-        The returned list does not contain the current position itself.
+        Returns the value of a referenced position, without evaluating anything. Positions are evaluated in the
+        dependency graph order, so every referenced cell was either evaluated already in the current evaluation, or
+        wasn't affected by it and has a valid stored value.
+        :raises EvaluationException: If the referenced cell doesn't exist.
         """
-        try:
-            # If there is a cycle in the graph, an exception is raised here.
-            total_order = list(nx.topological_sort(dependency_graph))
-            # Derive dependents_update_order by using the reversed graph's total order.
-            if current_position in dependency_graph:
-                dependents: Set[Position] = nx.descendants(dependency_graph.reverse(), current_position)
-                return [position for position in reversed(total_order) if position in dependents]
-            return []
-        except nx.NetworkXUnfeasible:
-            raise CircularDependenciesException("Cycle detected, new edges not added.")
-
-    def __evaluate_position(self, position: Position, evaluated_positions: Dict[Position, Value]) -> Value:
         # Attempt to fetch the updated results first (changes from the stored values).
         if position in evaluated_positions:
             return evaluated_positions[position]
-        # If the position is not cached anywhere, compute its value.
-        cell = self.__cells.get(position)
-        if not cell:
+        value: Optional[Value] = self.__cells_values.get(position)
+        if value is None:
             raise EvaluationException("Cell does not exist.")
-        content = cell.get_parsed_content()
-        value = self.__evaluate(content, evaluated_positions) if isinstance(content, Node) else content
-        # Update the local cache, but not the sheet-level stored values yet.
-        evaluated_positions[position] = value
         return value
 
-    def __evaluate(self, node: Node, reevaluated_values: Dict[Position, Value]) -> Value:
-        """
-        Recursively evaluates the syntax tree from the given node, while updating the reevaluated_values with evaluated
-         results.
-        """
-        if node.is_leaf():
-            return self.__evaluate_leaf_node(node, reevaluated_values)
-        return self.__evaluate_internal_node(node, reevaluated_values)
-
-    def __evaluate_leaf_node(self, node: Node, cache: Dict[Position, Value]) -> Value:
-        """
-        Evaluates a leaf node, using the cache for cell references.
-        """
-        if isinstance(node.value, float):
-            return node.value  # Directly return the numerical value.
-        if isinstance(node.value, str):
-            # Convert cell reference to position and fetch its value, using the cache.
-            cell_position = self.__cell_name_to_location(node.value)
-            return self.__evaluate_position(cell_position, cache)
-        # If node's value isn't float or string, raise an exception.
-        raise EvaluationException(f"Invalid leaf value: {node.value}")
-
-    def __evaluate_internal_node(self, node: Node, cache: Dict[Position, Value]) -> Value:
-        """
-        Evaluates the value of an internal node within the syntax tree of a cell formula. This method
-        handles different types of operations, including unary, binary, and range operations, by
-        executing the associated mathematical operation or function.
-
-        For unary and binary operations, it recursively evaluates the operands (children nodes) before
-        performing the operation. For range operations, it evaluates each cell within the specified range
-        and then applies the range operation to those values. The method uses a cache to store and reuse
-        previously calculated values for efficiency.
-
-        Parameters:
-            node: The internal node to evaluate, which must be an instance of MathOperator.
-            cache: A dictionary used to store and retrieve previously evaluated values by their positions
-                   to avoid redundant calculations.
-
-        Returns:
-            The evaluated numerical value of the node as a float.
-
-        Raises:
-            EvaluationException: If the node's value is not a supported operator, if operands are missing
-                                 for unary or binary operations, if operands for range operations are not
-                                 numerical, or if any other evaluation error occurs.
-        """
-        if not isinstance(node.value, MathOperator):
-            raise EvaluationException(f"Unsupported node value: {node.value}")
-        if isinstance(node.value, RangeOperator):
-            if not (isinstance(node.right.value, str) and node.left is None):
-                raise EvaluationException("Problem evaluating a Range Operator node.")
-            range_positions: Set[Position] = self.__calculate_range_positions(node.right.value)
-            range_values: List[Value] = [self.__evaluate_position(position, cache) for position in range_positions]
-            if any(isinstance(v, str) for v in range_values):
-                raise EvaluationException("Can't run range functions on string operands.")
-            return node.value.calculate(range_values)
-        # Retrieve values for left and right children if they exist.
-        left_val: Optional[Value] = self.__evaluate(node.left, cache) if node.left else None
-        right_val: Optional[Value] = self.__evaluate(node.right, cache) if node.right else None
-        if isinstance(left_val, str) or isinstance(left_val, str):
-            raise EvaluationException("Child nodes must have number evaluations.")
-        # Handle unary and binary operations.
-        if isinstance(node.value, UnaryOperator):
-            if right_val is None:
-                raise EvaluationException("Missing operand for unary operator.")
-            return node.value.calculate(right_val)
-        if isinstance(node.value, BinaryOperator):
-            if left_val is None or right_val is None:
-                raise EvaluationException("Missing operands for binary operator.")
-            return node.value.calculate(left_val, right_val)
-        # If the node's operator type is neither unary nor binary, raise an exception.
-        raise EvaluationException(f"Unsupported operator type: {type(node.value)}")
+    def __evaluate(self, formula: Formula, reevaluated_values: Dict[Position, Value]) -> Value:
+        """
+        Evaluates a compiled formula by running its instructions on a stack of values. Referenced cells are read from
+        the reevaluated_values first, and then from the stored values.
+        :raises EvaluationException: If an operator is applied on string values, or a referenced cell doesn't exist.
+        """
+        stack: List[Value] = []
+        for opcode, argument in formula.get_instructions():
+            if opcode is Opcode.PUSH_NUMBER:
+                stack.append(argument)
+            elif opcode is Opcode.PUSH_CELL:
+                stack.append(self.__evaluated_value(argument, reevaluated_values))
+            elif opcode is Opcode.APPLY_BINARY:
+                right_val: Value = stack.pop()
+                left_val: Value = stack.pop()
+                if isinstance(left_val, str) or isinstance(right_val, str):
+                    raise EvaluationException("Child nodes must have number evaluations.")
+                stack.append(argument(left_val, right_val))
+            elif opcode is Opcode.APPLY_UNARY:
+                operand: Value = stack.pop()
+                if isinstance(operand, str):
+                    raise EvaluationException("Child nodes must have number evaluations.")
+                stack.append(argument(operand))
+            else:
+                range_function, range_positions = argument
+                range_values: List[Value] = [self.__evaluated_value(position, reevaluated_values)
+                                             for position in range_positions]
+                if any(isinstance(v, str) for v in range_values):
+                    raise EvaluationException("Can't run range functions on string operands.")
+                stack.append(range_function(range_values))
+        return stack.pop()
 
     def try_save(self, file_name: str) -> bool:
         """
@@ -449,19 +522,20 @@ class Sheet:
         """
         try:
             with open(file_name, mode='w', newline='') as file:
-                csv_writer = csv.writer(file)
-                grid = self.__to_csv_table()
-                for row in grid:
-                    csv_writer.writerow(row)
+                # The whole table is written in a single call, and the file object buffers the output.
+                csv.writer(file).writerows(self.__to_csv_table())
             return True
         except Exception:
             return False
 
-    def __to_csv_table(self) -> List[List[str]]:
-        """Convert stored sheet data to a matrix of string values."""
-        grid = [["" for _ in range(self.COLUMNS_NUM)] for _ in range(self.ROWS_NUM)]
+    def __to_csv_table(self) -> List[List[Union[str, float]]]:
+        """
+        Convert stored sheet data to a matrix of values, with empty strings for empty cells.
+        Values are not quoted here - the csv writer quotes values that contain delimiters or quotes by itself.
+        """
+        grid: List[List[Union[str, float]]] = [[""] * self.COLUMNS_NUM for _ in range(self.ROWS_NUM)]
         for (row_index, column_index), value in self.__cells_values.items():
-            grid[row_index][column_index] = f'"{value}"' if isinstance(value, str) and "," in value else value
+            grid[row_index][column_index] = value
         return grid
 
     def __save_as_json(self, file_name: str) -> bool:
@@ -502,18 +576,21 @@ class Sheet:
         return cells
 
     @classmethod
-    def __calculate_range_positions(cls, range_value: str) -> Set[Position]:
+    @functools.lru_cache(maxsize=__RANGE_NAMES_CACHE_SIZE)
+    def __calculate_range_positions(cls, range_value: str) -> Tuple[Position, ...]:
         """
         Calculates and returns the positions within a specified cell range.
+        The results are cached (and therefore immutable tuples), since a range is expanded every time a formula that
+        uses it is compiled, and the same ranges are often used by many formulas.
 
         :param range_value: The cell range in the format 'A1:B2', where 'A1' is the start position and 'B2' is the end
          position.
-        :return: A set of positions within the specified range, each position represented as a tuple of row and column
-         indices.
+        :return: The positions within the specified range in their sheet order, each position represented as a tuple
+         of row and column indices.
         :raises BadNameException: If the range string is invalid or specifies a range outside the spreadsheet's
          dimensions.
         """
-        match = cls.__RANGE_NAME_PATTERN.match(range_value)
+        match = cls.__RANGE_NAME_PATTERN.fullmatch(range_value)
         if not match:
             raise BadNameException(f"Invalid cells range name format: {range_value}")
         row1_name = match.group(cls.__ROW1_GROUP)
@@ -524,13 +601,13 @@ class Sheet:
         col2_name = match.group(cls.__COL2_GROUP)
         end_position = cls.__row_name_to_index(row2_name), cls.__column_name_to_index(col2_name)
         end_row_index, end_col_index = end_position
-        # I return a set since the positions are unique.
+        # A range is a single row or column, so its positions are unique and are produced in order.
         if not (cls.__position_in_sheet_range(start_position) and cls.__position_in_sheet_range(end_position)):
             raise BadNameException("Range is not inside the sheet.")
         if start_row_index == end_row_index and start_col_index <= end_col_index:
-            return {(start_row_index, col) for col in range(start_col_index, end_col_index + 1)}
+            return tuple((start_row_index, col) for col in range(start_col_index, end_col_index + 1))
         elif start_col_index == end_col_index and start_row_index <= end_row_index:
-            return {(row, start_col_index) for row in range(start_row_index, end_row_index + 1)}
+            return tuple((row, start_col_index) for row in range(start_row_index, end_row_index + 1))
         raise BadNameException("Range name is not a valid range.")
 
     @classmethod